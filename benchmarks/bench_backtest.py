@@ -0,0 +1,48 @@
+"""backtest_forecastsの実行時間を計測する
+
+数百チーム×数千カットオフの規模で、スコープクリープの有無ごとに計測する。
+
+実行方法:
+    python benchmarks/bench_backtest.py [workers]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hello import backtest_forecasts  # noqa: E402
+
+NUM_TEAMS = 300
+NUM_SPRINTS = 40
+NUM_SIMULATIONS = 1000
+
+
+def main() -> None:
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else None
+    rng = np.random.default_rng(0)
+    histories = {
+        f"team{i}": list(np.maximum(0, rng.normal(30, 6, NUM_SPRINTS)))
+        for i in range(NUM_TEAMS)
+    }
+
+    print(f"{'scope creep':<14}{'cut-offs':>10}{'seconds':>10}")
+    for scope_creep in [0.0, 2.0]:
+        start = time.perf_counter()
+        df = backtest_forecasts(
+            histories,
+            scope_creep_mean=scope_creep,
+            scope_creep_std_dev=scope_creep,
+            num_simulations=NUM_SIMULATIONS,
+            rng=0,
+            workers=workers,
+        )
+        seconds = time.perf_counter() - start
+        print(f"{f'{scope_creep:g}%':<14}{len(df):>10}{seconds:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""旧来のグローバル乱数APIとGeneratorの乱数生成スループットを比較する
+
+実行方法:
+    python benchmarks/bench_rng.py
+"""
+
+import os
+import sys
+import timeit
+
+import numpy as np
+import scipy.stats as stats
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hello import BIT_GENERATORS, create_rng  # noqa: E402
+
+NUM_SAMPLES = 1_000_000
+REPEAT = 5
+DF = 5
+
+
+def throughput(func) -> float:
+    """1秒あたりの生成数（百万）を返す"""
+    seconds = min(timeit.repeat(func, number=1, repeat=REPEAT))
+    return NUM_SAMPLES / seconds / 1e6
+
+
+def main() -> None:
+    cases = {
+        "legacy np.random.normal": lambda: np.random.normal(1.0, 0.1, NUM_SAMPLES),
+        "legacy stats.t.rvs": lambda: stats.t.rvs(df=DF, size=NUM_SAMPLES),
+    }
+    for name in BIT_GENERATORS:
+        rng = create_rng(0, name)
+        cases[f"{name} normal"] = lambda rng=rng: rng.normal(1.0, 0.1, NUM_SAMPLES)
+        cases[f"{name} standard_t"] = lambda rng=rng: rng.standard_t(DF, NUM_SAMPLES)
+
+    print(f"{'case':<26}{'Mdraws/s':>10}")
+    for name, func in cases.items():
+        print(f"{name:<26}{throughput(func):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
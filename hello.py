@@ -1,16 +1,52 @@
+import fcntl
 import os
-from typing import Callable, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Sequence, Tuple
 
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-import scipy.stats as stats
 import streamlit as st
 import yaml
 from matplotlib import font_manager as fm
 
 FONT_PATH = os.path.join(os.getcwd(), "NOTO_SANS_JP/NotoSansJP-Regular.otf")
 FONT_PROP = fm.FontProperties(fname=FONT_PATH)
+FORECAST_ARCHIVE_PATH = os.path.join(os.getcwd(), "forecast_archive")
+
+BIT_GENERATORS = {
+    "PCG64": np.random.PCG64,
+    "SFC64": np.random.SFC64,
+    "Philox": np.random.Philox,
+    "MT19937": np.random.MT19937,
+}
+
+# 乱数の発生源。Generatorかシード値を受け取り、Noneの場合は毎回異なる乱数になる。
+# シード値からは毎回新しいGeneratorが作られるため、サンプラーとシミュレーションに
+# 同じシード値を渡すと同じ乱数列が使われ、ベロシティとスコープクリープが相関する。
+# 両方を再現可能にする場合は同じGeneratorを共有すること
+RngLike = np.random.Generator | int | None
+
+
+def create_rng(
+    seed: int | None = None, bit_generator: str = "PCG64"
+) -> np.random.Generator:
+    """
+    Create a random number generator with the selected bit generator.
+
+    Args:
+        seed (int | None): Seed for reproducible runs. None draws fresh entropy.
+        bit_generator (str): One of the keys of ``BIT_GENERATORS``.
+
+    Returns:
+        np.random.Generator: Generator to pass as ``rng``.
+
+    Raises:
+        ValueError: If bit_generator is unknown
+    """
+    if bit_generator not in BIT_GENERATORS:
+        raise ValueError(f"未対応の乱数生成器です: {bit_generator}")
+    return np.random.Generator(BIT_GENERATORS[bit_generator](seed))
 
 
 def load_checklist() -> List[str]:
@@ -42,12 +78,17 @@ class Percentile:
         return self.start_date + pd.DateOffset(days=self.sprints * self.sprint_duration)
 
 
-def create_velocity_sampler(data: List[float]) -> Callable[[int], np.ndarray]:
+def create_velocity_sampler(
+    data: List[float], rng: RngLike = None
+) -> Callable[[int], np.ndarray]:
     """
     Generate random samples for the true mean based on a t-distribution.
 
     Parameters:
     - data: list or array-like, the sample data
+    - rng: numpy Generator or seed, the source of random numbers (default: None).
+      Share one Generator with monte_carlo_simulation instead of passing both
+      the same seed, which would correlate their draws.
     - num_samples: int, number of random samples to generate (default: 1000)
 
     Returns:
@@ -76,19 +117,26 @@ def create_velocity_sampler(data: List[float]) -> Callable[[int], np.ndarray]:
     sem = std / np.sqrt(max(1, n))  # nが0になることを防ぐ
     df = max(1, n - 1)  # 自由度が0以下にならないようにする
 
+    rng = np.random.default_rng(rng)
+
     def sampler(num_samples: int = 1000) -> np.ndarray:
-        t_dist = stats.t.rvs(df=df, size=num_samples)
+        t_dist = rng.standard_t(df, num_samples)
         return mean + sem * t_dist
 
     return sampler
 
 
-def guess_velocity_posterior(data: List[float]) -> Callable[[int], np.ndarray]:
+def guess_velocity_posterior(
+    data: List[float], rng: RngLike = None
+) -> Callable[[int], np.ndarray]:
     """
     Generate the posterior distribution of the true mean using Bayes' theorem.
 
     Parameters:
     - data: list or array-like, the observed sample data
+    - rng: numpy Generator or seed, the source of random numbers (default: None).
+      Share one Generator with monte_carlo_simulation instead of passing both
+      the same seed, which would correlate their draws.
     - prior_mean: float, the mean of the prior distribution
     - prior_std: float, the standard deviation of the prior distribution
     - num_samples: int, number of random samples to generate (default: 1000)
@@ -125,10 +173,11 @@ def guess_velocity_posterior(data: List[float]) -> Callable[[int], np.ndarray]:
         prior_mean / prior_std**2 + n * sample_mean / max(sample_std**2, 1e-10)
     )
     posterior_std = np.sqrt(posterior_variance)
-    st.write(f"post mean: {posterior_mean:.2f}, Post std: {posterior_std:.2f}")
+
+    rng = np.random.default_rng(rng)
 
     def velocity_sampler(num_samples: int = 1000) -> np.ndarray:
-        return np.random.normal(posterior_mean, posterior_std, num_samples)
+        return rng.normal(posterior_mean, posterior_std, num_samples)
 
     return velocity_sampler
 
@@ -161,8 +210,6 @@ def main() -> None:
         st.error("ベロシティはカンマ区切りの正の整数で入力してください。")
         return
 
-    velocity_sampler = create_velocity_sampler(velocity_list)
-
     st.header("スコープクリープ")
     st.caption(
         "現在の合計ストーリーに潜在するリスクが大きい場合は大きい値を設定してください"
@@ -220,15 +267,21 @@ def main() -> None:
     num_simulations = st.number_input(
         "シミュレーション回数", min_value=2000, max_value=5000, value=3000, step=100
     )
+    # 同じシードを指定すると同じ結果を再現できる。未入力の場合は毎回異なる
+    seed = st.number_input("乱数シード", min_value=0, value=None, step=1)
+    bit_generator = st.selectbox("乱数生成器", list(BIT_GENERATORS.keys()), index=0)
+    rng = create_rng(None if seed is None else int(seed), bit_generator)
 
     # 設定値の確認
 
+    velocity_sampler = create_velocity_sampler(velocity_list, rng=rng)
     simulation_results = monte_carlo_simulation(
         story_point=story_point,
         velocity_sampler=velocity_sampler,
         scope_creep_mean=scope_creep_mean,
         scope_creep_std_dev=scope_creep_std_dev,
         num_simulations=num_simulations,
+        rng=rng,
     )
     median = Percentile(
         "red", simulation_results, 50, "中央値", start_date, sprint_duration
@@ -346,6 +399,30 @@ def main() -> None:
     # Streamlitでテーブル表示
     st.table(df.style.hide(axis="index"))
 
+    st.header("予測の履歴")
+    st.caption("チーム名を入力して予測を保存すると、予測ラインの推移を確認できます。")
+    team = st.text_input("チーム名", "")
+    if team:
+        archive = ForecastArchive(FORECAST_ARCHIVE_PATH)
+        if st.button("予測を保存"):
+            try:
+                archive.append(
+                    team=team,
+                    date=pd.Timestamp("today"),
+                    start_date=start_date,
+                    simulation_results=simulation_results,
+                    story_point=story_point,
+                    velocities=velocity_list,
+                    scope_creep_mean=scope_creep_mean,
+                    scope_creep_std_dev=scope_creep_std_dev,
+                    sprint_duration=sprint_duration,
+                )
+            except ValueError as e:
+                st.error(str(e))
+        trend = archive.percentile_trend(team)
+        if not trend.empty:
+            st.line_chart(trend)
+
 
 def monte_carlo_simulation(
     story_point: int,
@@ -353,6 +430,7 @@ def monte_carlo_simulation(
     scope_creep_mean: float,
     scope_creep_std_dev: float,
     num_simulations: int,
+    rng: RngLike = None,
 ) -> np.ndarray:
     """
     Run Monte Carlo simulation to estimate the number of sprints needed.
@@ -367,38 +445,478 @@ def monte_carlo_simulation(
             due to scope creep.
         scope_creep_std_dev (float): Standard deviation of scope creep.
         num_simulations (int): Number of Monte Carlo simulations to run.
+        rng (RngLike): Generator or seed used for scope creep. Pass the
+            Generator shared with ``velocity_sampler``; the same integer seed
+            for both would correlate velocity and scope creep.
 
     Returns:
         np.ndarray: Array of the number of sprints required for each simulation.
     """
+    velocities = velocity_sampler(num_simulations)
+    return simulate_sprints(
+        story_point, velocities, scope_creep_mean, scope_creep_std_dev, rng
+    )
+
+
+def simulate_sprints(
+    story_points: float | np.ndarray,
+    velocities: np.ndarray,
+    scope_creep_mean: float,
+    scope_creep_std_dev: float,
+    rng: RngLike = None,
+) -> np.ndarray:
+    """
+    Simulate the number of sprints needed for every sampled velocity at once.
+
+    Each element of ``velocities`` is one simulation run. All runs advance one
+    sprint per step together, so the Python loop runs once per sprint rather
+    than once per simulation run.
+
+    Args:
+        story_points (float | np.ndarray): Remaining story points. Must be
+            broadcastable to the shape of ``velocities`` (e.g. shape
+            ``(n, 1)`` for ``n`` independent forecasts).
+        velocities (np.ndarray): Sampled velocity for each simulation run.
+        scope_creep_mean (float): Mean percentage increase in story points per
+            sprint due to scope creep.
+        scope_creep_std_dev (float): Standard deviation of scope creep.
+        rng (RngLike): Generator or seed used for scope creep. Do not pass
+            the seed that also produced ``velocities``.
+
+    Returns:
+        np.ndarray: Number of sprints required, with the shape of ``velocities``.
+    """
+    rng = np.random.default_rng(rng)
+    velocities = np.maximum(0, np.asarray(velocities, dtype=float))
+    shape = velocities.shape
+    total_tasks = np.broadcast_to(story_points, shape).ravel()
+    sprints = np.zeros(total_tasks.size)
+
+    # ベロシティが0以下では終わらないため、上限の301スプリントとする
+    velocity = velocities.ravel()
+    sprints[(total_tasks > 0) & (velocity <= 0)] = 301
+
+    # 未完了のシミュレーションだけを詰めて保持する。
+    # 全て同じスプリント数だけ進んでいるため、経過スプリント数は sprint で共通
+    active = np.flatnonzero((total_tasks > 0) & (velocity > 0))
+    remaining = total_tasks[active].astype(float)
+    velocity_per_sprint = velocity[active]
+    sprint = 0
+    # 無限ループを防ぐため300スプリントを超えたら打ち切る
+    while active.size and sprint <= 300:
+        # 残りがベロシティ以下なら最後のスプリントとして端数を計算する。
+        # 前のスプリントで残りが0以下になったものは端数が0になる
+        last = remaining <= velocity_per_sprint
+        sprints[active[last]] = sprint + (
+            np.maximum(remaining[last], 0) / velocity_per_sprint[last]
+        )
+        keep = ~last
+        active = active[keep]
+        remaining = remaining[keep]
+        velocity_per_sprint = velocity_per_sprint[keep]
+
+        sprint += 1
+        if scope_creep_std_dev:
+            creep_rate = rng.normal(
+                1 + scope_creep_mean / 100, scope_creep_std_dev / 100, active.size
+            )
+        else:
+            # 分散がなければ乱数を引かずに済ませる
+            creep_rate = 1 + scope_creep_mean / 100
+        remaining *= creep_rate
+        remaining -= velocity_per_sprint
+
+    sprints[active] = sprint
+    return sprints.reshape(shape)
+
+
+BACKTEST_PERCENTILES = (50, 60, 80, 90)
+
+
+def backtest_forecasts(
+    histories: Dict[str, List[float]],
+    sampler_factory: Callable[..., Callable[[int], np.ndarray]] = (
+        create_velocity_sampler
+    ),
+    scope_creep_mean: float = 0.0,
+    scope_creep_std_dev: float = 0.0,
+    num_simulations: int = 1000,
+    min_history: int = 1,
+    percentiles: Sequence[float] = BACKTEST_PERCENTILES,
+    batch_size: int = 1000,
+    rng: RngLike = None,
+    workers: int | None = None,
+) -> pd.DataFrame:
+    """
+    Replay forecasts at every cut-off point of each team's sprint history.
+
+    At cut-off ``k`` the first ``k`` velocities are fed to ``sampler_factory``
+    and the story points actually completed afterwards are forecast. The
+    actual finish is the number of sprints the team really needed. Cut-offs
+    are simulated together in batches of ``batch_size`` with
+    ``simulate_sprints``, and batches run in parallel threads.
+
+    Args:
+        histories (Dict[str, List[float]]): Completed velocity per sprint,
+            keyed by team.
+        sampler_factory (Callable): ``create_velocity_sampler`` or
+            ``guess_velocity_posterior``. Called with the history and ``rng``.
+        scope_creep_mean (float): Mean percentage increase in story points per
+            sprint due to scope creep.
+        scope_creep_std_dev (float): Standard deviation of scope creep.
+        num_simulations (int): Number of simulation runs per cut-off.
+        min_history (int): Number of sprints required before the first cut-off.
+        percentiles (Sequence[float]): Percentile lines to forecast.
+        batch_size (int): Number of cut-offs simulated in one batch.
+        rng (RngLike): Generator or seed. Each batch draws from its own child
+            generator, so results do not depend on ``workers``.
+        workers (int | None): Number of threads. None uses ``os.cpu_count()``.
+
+    Returns:
+        pd.DataFrame: One row per cut-off with the columns ``team``,
+        ``cutoff``, ``story_point``, ``actual_sprints`` and one ``p<N>``
+        column per percentile line.
 
-    # Array to store results
-    simulation_results = []
-
-    for _ in range(num_simulations):
-        total_tasks = float(story_point)
-        velocity_per_sprint = max(0, velocity_sampler(1)[0])
-        sprints = 0.0
-        while total_tasks > 0:
-            if sprints > 300:
-                # Limit the number of sprints to prevent infinite loops
-                # print("Exceeded 300 sprints, breaking loop.")
-                break
-            if total_tasks <= velocity_per_sprint:
-                # Last sprint - calculate partial sprint
-                sprints += total_tasks / velocity_per_sprint
-                break
-            else:
-                sprints += 1
-                creep_rate = np.random.normal(
-                    1 + scope_creep_mean / 100, scope_creep_std_dev / 100
+    Raises:
+        ValueError: If min_history or batch_size is less than 1
+    """
+    if min_history < 1:
+        raise ValueError("min_historyは1以上を指定してください。")
+    if batch_size < 1:
+        raise ValueError("batch_sizeは1以上を指定してください。")
+    rng = np.random.default_rng(rng)
+
+    cutoffs = [
+        (team, k, float(sum(history[k:])), float(len(history) - k))
+        for team, history in histories.items()
+        for k in range(min_history, len(history))
+    ]
+    columns = [f"p{p:g}" for p in percentiles]
+
+    def forecast(
+        batch: List[Tuple[str, int, float, float]], batch_rng: np.random.Generator
+    ) -> np.ndarray:
+        velocities = np.stack(
+            [
+                sampler_factory(list(histories[team][:k]), rng=batch_rng)(
+                    num_simulations
                 )
-                total_tasks = total_tasks * creep_rate
-                total_tasks -= velocity_per_sprint
+                for team, k, _, _ in batch
+            ]
+        )
+        story_points = np.array([[story_point] for _, _, story_point, _ in batch])
+        results = simulate_sprints(
+            story_points, velocities, scope_creep_mean, scope_creep_std_dev, batch_rng
+        )
+        return np.percentile(results, percentiles, axis=1).T
+
+    batches = [cutoffs[i : i + batch_size] for i in range(0, len(cutoffs), batch_size)]
+    # NumPyの乱数生成と配列演算はGILを解放するため、スレッドで並列に実行できる
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        forecasts = list(executor.map(forecast, batches, rng.spawn(len(batches))))
+
+    df = pd.DataFrame(
+        cutoffs, columns=["team", "cutoff", "story_point", "actual_sprints"]
+    )
+    lines = np.concatenate(forecasts) if forecasts else np.empty((0, len(columns)))
+    return df.join(pd.DataFrame(lines, columns=columns))
+
+
+def score_calibration(
+    backtest: pd.DataFrame, percentiles: Sequence[float] = BACKTEST_PERCENTILES
+) -> pd.Series:
+    """
+    Compute how often the actual finish fell inside each percentile line.
+
+    A calibrated forecast hits the N% line in about N% of the cut-offs.
+
+    Args:
+        backtest (pd.DataFrame): Result of ``backtest_forecasts``.
+        percentiles (Sequence[float]): Percentile lines to score.
+
+    Returns:
+        pd.Series: Hit rate in percent, indexed by percentile.
+    """
+    return pd.Series(
+        {
+            p: (backtest["actual_sprints"] <= backtest[f"p{p:g}"]).mean() * 100
+            for p in percentiles
+        },
+        name="hit_rate",
+        dtype=float,
+    )
+
+
+FORECAST_TEAM_LENGTH = 32
+FORECAST_INDEX_DTYPE = np.dtype(
+    [
+        ("team", f"U{FORECAST_TEAM_LENGTH}"),
+        ("date", "datetime64[D]"),
+        ("start_date", "datetime64[D]"),
+        ("story_point", np.float64),
+        ("scope_creep_mean", np.float64),
+        ("scope_creep_std_dev", np.float64),
+        ("sprint_duration", np.int64),
+        ("sample_offset", np.int64),
+        ("sample_count", np.int64),
+        ("velocity_offset", np.int64),
+        ("velocity_count", np.int64),
+    ]
+)
+
+
+class ForecastArchive:
+    """
+    On-disk archive of forecast distributions, appended one forecast at a time.
 
-        simulation_results.append(sprints)
+    The archive is a directory of columnar files that are opened with
+    ``np.memmap`` so reading years of forecasts does not copy them into memory:
 
-    return np.array(simulation_results)
+    - ``index.bin``: one ``FORECAST_INDEX_DTYPE`` record per forecast
+    - ``samples.f32``: simulated sprint counts of all forecasts as float32
+    - ``velocities.f64``: input velocities of all forecasts
+
+    The index record is written last, and each append first truncates the
+    files to the data referenced by the index. Data left by an interrupted
+    write is therefore never referenced and is overwritten by the next append.
+    Appends hold an exclusive ``flock`` on ``append.lock``, so threads and
+    processes can append to the same archive.
+
+    Lookups by team go through a team -> positions index sorted by date. It is
+    built from the index file on the first lookup and only extended with
+    records appended since, so each lookup reads just that team's dates.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        self._positions: Dict[str, np.ndarray] = {}
+        self._indexed_count = 0
+
+    def _file(self, name: str) -> str:
+        return os.path.join(self.path, name)
+
+    def _open(self, name: str, dtype: np.dtype) -> np.ndarray:
+        file = self._file(name)
+        count = os.path.getsize(file) // dtype.itemsize if os.path.exists(file) else 0
+        if count == 0:
+            # 空のファイルはmemmapできない
+            return np.empty(0, dtype=dtype)
+        return np.memmap(file, dtype=dtype, mode="r", shape=(count,))
+
+    def _append_values(
+        self,
+        name: str,
+        values: np.ndarray | List[float],
+        dtype: type | np.dtype,
+        offset: int,
+    ) -> Tuple[int, int]:
+        file = self._file(name)
+        data = np.asarray(values, dtype=dtype).ravel()
+        with open(file, "ab") as f:
+            # offset以降は中断された書き込みの残りなので切り詰めてから追記する
+            f.truncate(offset * data.itemsize)
+            data.tofile(f)
+        return offset, data.size
+
+    @property
+    def records(self) -> np.ndarray:
+        """Index of all forecasts in the order they were appended."""
+        return self._open("index.bin", FORECAST_INDEX_DTYPE)
+
+    def append(
+        self,
+        team: str,
+        date: pd.Timestamp,
+        start_date: pd.Timestamp,
+        simulation_results: np.ndarray,
+        story_point: float,
+        velocities: List[float],
+        scope_creep_mean: float,
+        scope_creep_std_dev: float,
+        sprint_duration: int,
+    ) -> int:
+        """
+        Append a forecast and its input parameters.
+
+        ``date`` is the day the forecast was made and ``start_date`` is the day
+        its sprint counts are measured from.
+
+        Returns:
+            int: Position of the forecast in the archive.
+
+        Raises:
+            ValueError: If team is empty or too long, or simulation_results is
+                empty
+        """
+        if not team or len(team) > FORECAST_TEAM_LENGTH:
+            raise ValueError(
+                f"チーム名は1文字以上{FORECAST_TEAM_LENGTH}文字以下で入力してください。"
+            )
+        if np.size(simulation_results) == 0:
+            raise ValueError("シミュレーション結果が空です。")
+
+        # 他のスレッドやプロセスと同時に追記すると、オフセットの読み取りから
+        # インデックスの書き込みまでの間に互いのデータを切り詰めてしまうため、
+        # 追記全体を排他ロックする
+        with open(self._file("append.lock"), "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            records = self.records
+            position = len(records)
+            sample_end = velocity_end = 0
+            if position:
+                last = records[-1]
+                sample_end = int(last["sample_offset"] + last["sample_count"])
+                velocity_end = int(last["velocity_offset"] + last["velocity_count"])
+
+            samples = self._append_values(
+                "samples.f32", simulation_results, np.float32, sample_end
+            )
+            inputs = self._append_values(
+                "velocities.f64", velocities, np.float64, velocity_end
+            )
+            record = np.array(
+                [
+                    (
+                        team,
+                        np.datetime64(pd.Timestamp(date).date(), "D"),
+                        np.datetime64(pd.Timestamp(start_date).date(), "D"),
+                        story_point,
+                        scope_creep_mean,
+                        scope_creep_std_dev,
+                        sprint_duration,
+                        *samples,
+                        *inputs,
+                    )
+                ],
+                dtype=FORECAST_INDEX_DTYPE,
+            )
+            self._append_values("index.bin", record, FORECAST_INDEX_DTYPE, position)
+        return position
+
+    def find(
+        self,
+        team: str,
+        start: pd.Timestamp | None = None,
+        end: pd.Timestamp | None = None,
+    ) -> np.ndarray:
+        """
+        Look up forecasts of a team, optionally limited to a date range.
+
+        Returns:
+            np.ndarray: Positions of the matching forecasts, sorted by date.
+        """
+        return self._find(self.records, team, start, end)
+
+    def _find(
+        self,
+        records: np.ndarray,
+        team: str,
+        start: pd.Timestamp | None = None,
+        end: pd.Timestamp | None = None,
+    ) -> np.ndarray:
+        if len(records) != self._indexed_count:
+            self._index_records(records)
+        positions = self._positions.get(team, np.empty(0, dtype=np.int64))
+        # 日付順に並んでいるため、期間は二分探索で絞り込める
+        dates = records["date"][positions]
+        lo, hi = 0, len(positions)
+        if start is not None:
+            lo = np.searchsorted(dates, np.datetime64(pd.Timestamp(start).date(), "D"))
+        if end is not None:
+            hi = np.searchsorted(
+                dates, np.datetime64(pd.Timestamp(end).date(), "D"), side="right"
+            )
+        return positions[lo:hi]
+
+    def _index_records(self, records: np.ndarray) -> None:
+        if len(records) < self._indexed_count:
+            # インデックスファイルが作り直された場合は最初から索引を作る
+            self._positions, self._indexed_count = {}, 0
+
+        # 前回以降に追記されたレコードだけをチームごとにまとめて追加する
+        new = np.arange(self._indexed_count, len(records))
+        if new.size == 0:
+            return
+        teams = records["team"][new]
+        order = np.argsort(teams, kind="stable")
+        names, starts = np.unique(teams[order], return_index=True)
+        for name, group in zip(names, np.split(new[order], starts[1:]), strict=True):
+            positions = np.concatenate(
+                [self._positions.get(str(name), np.empty(0, dtype=np.int64)), group]
+            )
+            self._positions[str(name)] = positions[
+                np.argsort(records["date"][positions], kind="stable")
+            ]
+        self._indexed_count = len(records)
+
+    def distribution(self, position: int) -> np.ndarray:
+        """Simulated sprint counts of a forecast, without copying."""
+        record = self.records[position]
+        offset, count = record["sample_offset"], record["sample_count"]
+        return self._open("samples.f32", np.dtype(np.float32))[offset : offset + count]
+
+    def velocities(self, position: int) -> np.ndarray:
+        """Input velocities of a forecast, without copying."""
+        record = self.records[position]
+        offset, count = record["velocity_offset"], record["velocity_count"]
+        return self._open("velocities.f64", np.dtype(np.float64))[
+            offset : offset + count
+        ]
+
+    def percentile_trend(
+        self, team: str, percentiles: Sequence[float] = BACKTEST_PERCENTILES
+    ) -> pd.DataFrame:
+        """
+        Track how the percentile lines of a team moved over time.
+
+        Returns:
+            pd.DataFrame: Sprint count of each percentile line, indexed by the
+            forecast date with one ``p<N>`` column per percentile.
+        """
+        # 予測ごとに開き直さないよう、インデックスと分布は一度だけ開く
+        records = self.records
+        samples = self._open("samples.f32", np.dtype(np.float32))
+        positions = self._find(records, team)
+        lines = [
+            np.percentile(samples[offset : offset + count], percentiles)
+            for offset, count in zip(
+                records["sample_offset"][positions],
+                records["sample_count"][positions],
+                strict=True,
+            )
+        ]
+        return pd.DataFrame(
+            np.reshape(lines, (len(positions), len(percentiles))),
+            index=pd.DatetimeIndex(records["date"][positions], name="date"),
+            columns=[f"p{p:g}" for p in percentiles],
+        )
+
+    def finish_date_trend(
+        self, team: str, percentiles: Sequence[float] = BACKTEST_PERCENTILES
+    ) -> pd.DataFrame:
+        """
+        Track how the finish date of each percentile line moved over time.
+
+        Returns:
+            pd.DataFrame: Finish date of each percentile line, indexed by the
+            forecast date with one ``p<N>`` column per percentile.
+        """
+        trend = self.percentile_trend(team, percentiles)
+        records = self.records[self.find(team)]
+        start_date = pd.DatetimeIndex(records["start_date"])
+        sprint_duration = records["sprint_duration"]
+        # Percentile.finish_dateと同じく端数の日は切り捨てる
+        return pd.DataFrame(
+            {
+                column: start_date
+                + pd.to_timedelta(
+                    np.trunc(trend[column].to_numpy() * sprint_duration), "D"
+                )
+                for column in trend.columns
+            },
+            index=trend.index,
+        )
 
 
 if __name__ == "__main__":
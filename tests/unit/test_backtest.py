@@ -0,0 +1,126 @@
+"""backtest_forecasts関数とscore_calibration関数のテスト"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from conftest import create_mock_velocity_sampler
+
+from hello import (
+    BACKTEST_PERCENTILES,
+    backtest_forecasts,
+    create_velocity_sampler,
+    guess_velocity_posterior,
+    score_calibration,
+)
+
+
+def mock_sampler_factory(data, rng=None):
+    """直近のベロシティの平均値を返すサンプラーを作成"""
+    return create_mock_velocity_sampler(float(np.mean(data)))
+
+
+def test_backtest_forecasts_cutoffs():
+    """カットオフごとの残りストーリーと実績スプリント数のテスト"""
+    histories = {"a": [10.0, 10.0, 10.0, 10.0], "b": [5.0, 5.0]}
+    df = backtest_forecasts(
+        histories, sampler_factory=mock_sampler_factory, num_simulations=100
+    )
+    assert df["team"].tolist() == ["a", "a", "a", "b"]
+    assert df["cutoff"].tolist() == [1, 2, 3, 1]
+    assert df["story_point"].tolist() == [30.0, 20.0, 10.0, 5.0]
+    assert df["actual_sprints"].tolist() == [3.0, 2.0, 1.0, 1.0]
+    # ベロシティが一定なら全てのパーセンタイルが実績と一致する
+    for p in BACKTEST_PERCENTILES:
+        assert df[f"p{p}"].tolist() == df["actual_sprints"].tolist()
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 1000])
+def test_backtest_forecasts_batch_size(batch_size):
+    """バッチサイズによらず同じ結果になることのテスト"""
+    histories = {"a": [10.0, 12.0, 8.0, 10.0], "b": [5.0, 6.0, 4.0]}
+    df = backtest_forecasts(
+        histories,
+        sampler_factory=mock_sampler_factory,
+        num_simulations=10,
+        batch_size=batch_size,
+    )
+    assert len(df) == 5
+    assert np.all(df["p50"] <= df["p90"])
+
+
+@pytest.mark.parametrize(
+    "sampler_factory", [create_velocity_sampler, guess_velocity_posterior]
+)
+def test_backtest_forecasts_samplers(sampler_factory):
+    """実際のサンプラーで予測した場合のテスト"""
+    rng = np.random.default_rng(0)
+    histories = {f"team{i}": list(rng.normal(20, 3, 12)) for i in range(5)}
+    df = backtest_forecasts(histories, sampler_factory=sampler_factory, min_history=3)
+    assert len(df) == 5 * 9
+    assert np.all(df["p50"] <= df["p60"])
+    assert np.all(df["p80"] <= df["p90"])
+
+    scores = score_calibration(df)
+    assert scores.index.tolist() == list(BACKTEST_PERCENTILES)
+    assert np.all((scores >= 0) & (scores <= 100))
+
+
+def test_backtest_forecasts_no_output(monkeypatch):
+    """バックテスト中に画面出力しないことのテスト"""
+
+    def fail(*args, **kwargs):
+        raise AssertionError("st.writeが呼ばれました")
+
+    monkeypatch.setattr("hello.st.write", fail)
+    df = backtest_forecasts(
+        {"a": [10.0, 12.0, 11.0]},
+        sampler_factory=guess_velocity_posterior,
+        num_simulations=10,
+    )
+    assert len(df) == 2
+
+
+def test_backtest_forecasts_short_history():
+    """カットオフが存在しない場合のテスト"""
+    df = backtest_forecasts({"a": [10.0]}, sampler_factory=mock_sampler_factory)
+    assert df.empty
+    assert "p90" in df.columns
+
+
+@pytest.mark.parametrize("kwargs", [{"min_history": 0}, {"batch_size": 0}])
+def test_backtest_forecasts_invalid_args(kwargs):
+    """不正な引数の場合のテスト"""
+    with pytest.raises(ValueError):
+        backtest_forecasts({"a": [10.0, 10.0]}, **kwargs)
+
+
+def test_score_calibration():
+    """実績がパーセンタイル以内に収まった割合のテスト"""
+    df = pd.DataFrame(
+        {
+            "actual_sprints": [1.0, 2.0, 3.0, 4.0],
+            "p50": [1.0, 1.0, 1.0, 1.0],
+            "p90": [5.0, 5.0, 5.0, 3.0],
+        }
+    )
+    scores = score_calibration(df, percentiles=(50, 90))
+    assert scores[50] == 25.0
+    assert scores[90] == 75.0
+
+
+def test_backtest_forecasts_workers():
+    """並列数によらず同じシードなら同じ結果になることのテスト"""
+    histories = {f"team{i}": [10.0, 12.0, 8.0, 11.0, 9.0] for i in range(4)}
+
+    def backtest(workers):
+        return backtest_forecasts(
+            histories,
+            scope_creep_mean=2.0,
+            scope_creep_std_dev=2.0,
+            num_simulations=100,
+            batch_size=3,
+            rng=0,
+            workers=workers,
+        )
+
+    assert backtest(1).equals(backtest(4))
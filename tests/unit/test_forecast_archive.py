@@ -0,0 +1,219 @@
+"""ForecastArchiveクラスのテスト"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from hello import ForecastArchive
+
+
+def append_forecast(archive, team, date, results, start_date="2024-01-01"):
+    """テスト用の予測を保存する"""
+    return archive.append(
+        team=team,
+        date=pd.Timestamp(date),
+        start_date=pd.Timestamp(start_date),
+        simulation_results=np.asarray(results),
+        story_point=300,
+        velocities=[50, 55],
+        scope_creep_mean=2.0,
+        scope_creep_std_dev=2.0,
+        sprint_duration=14,
+    )
+
+
+def test_empty_archive(tmp_path):
+    """空のアーカイブのテスト"""
+    archive = ForecastArchive(str(tmp_path / "archive"))
+    assert len(archive.records) == 0
+    assert len(archive.find("a")) == 0
+    assert archive.percentile_trend("a").empty
+
+
+def test_append_and_read(tmp_path):
+    """保存した予測と入力パラメータが読み出せることのテスト"""
+    archive = ForecastArchive(str(tmp_path))
+    assert append_forecast(archive, "a", "2024-01-01", [1.0, 2.0, 3.0]) == 0
+    assert append_forecast(archive, "b", "2024-01-01", [4.0, 5.0]) == 1
+
+    distribution = archive.distribution(1)
+    assert isinstance(distribution, np.memmap)
+    assert distribution.dtype == np.float32
+    assert distribution.tolist() == [4.0, 5.0]
+    assert archive.velocities(0).tolist() == [50.0, 55.0]
+
+    record = archive.records[0]
+    assert record["team"] == "a"
+    assert record["date"] == np.datetime64("2024-01-01")
+    assert record["start_date"] == np.datetime64("2024-01-01")
+    assert record["story_point"] == 300
+    assert record["sprint_duration"] == 14
+
+    # 別のインスタンスから開き直しても同じ内容が読める
+    reopened = ForecastArchive(str(tmp_path))
+    assert reopened.distribution(0).tolist() == [1.0, 2.0, 3.0]
+
+
+@pytest.mark.parametrize(
+    "name, garbage",
+    [
+        ("samples.f32", b"\x01\x02"),
+        ("velocities.f64", b"\x01\x02\x03"),
+        ("index.bin", b"\x01" * 10),
+    ],
+)
+def test_append_after_interrupted_write(tmp_path, name, garbage):
+    """書き込みが中断されて残ったデータが次の追記に影響しないことのテスト"""
+    archive = ForecastArchive(str(tmp_path))
+    append_forecast(archive, "a", "2024-01-01", [1.0, 2.0])
+    with open(tmp_path / name, "ab") as f:
+        f.write(garbage)
+
+    assert append_forecast(archive, "b", "2024-01-02", [3.0, 4.0]) == 1
+    assert len(archive.records) == 2
+    assert archive.records[1]["team"] == "b"
+    assert archive.records[1]["date"] == np.datetime64("2024-01-02")
+    assert archive.distribution(0).tolist() == [1.0, 2.0]
+    assert archive.distribution(1).tolist() == [3.0, 4.0]
+    assert archive.velocities(1).tolist() == [50.0, 55.0]
+
+
+def test_append_after_unreferenced_data(tmp_path):
+    """インデックスを書く前に中断された予測のデータが上書きされることのテスト"""
+    archive = ForecastArchive(str(tmp_path))
+    append_forecast(archive, "a", "2024-01-01", [1.0, 2.0])
+    # 分布まで書いてインデックスを書く前に中断された状態
+    with open(tmp_path / "samples.f32", "ab") as f:
+        np.array([9.0, 9.0, 9.0], dtype=np.float32).tofile(f)
+
+    append_forecast(archive, "b", "2024-01-02", [3.0, 4.0])
+    assert archive.distribution(1).tolist() == [3.0, 4.0]
+    assert (tmp_path / "samples.f32").stat().st_size == 4 * 4
+
+
+def test_concurrent_append(tmp_path):
+    """複数のスレッドから同時に追記しても予測が失われないことのテスト"""
+
+    def append_many(worker):
+        # 別々に開いたアーカイブから、予測ごとに異なる値を書き込む
+        archive = ForecastArchive(str(tmp_path))
+        for i in range(50):
+            append_forecast(
+                archive, f"team{worker}", "2024-01-01", np.full(i + 1, worker * 100 + i)
+            )
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(append_many, range(4)))
+
+    archive = ForecastArchive(str(tmp_path))
+    assert len(archive.records) == 200
+    for worker in range(4):
+        positions = archive.find(f"team{worker}")
+        assert sorted(len(archive.distribution(p)) for p in positions) == list(
+            range(1, 51)
+        )
+        for position in positions:
+            distribution = archive.distribution(position)
+            assert np.all(distribution == worker * 100 + len(distribution) - 1)
+
+
+def test_find_by_team_and_date(tmp_path):
+    """チームと日付による検索のテスト"""
+    archive = ForecastArchive(str(tmp_path))
+    append_forecast(archive, "a", "2024-01-15", [1.0])
+    append_forecast(archive, "b", "2024-01-01", [1.0])
+    append_forecast(archive, "a", "2024-01-01", [1.0])
+    append_forecast(archive, "a", "2024-02-01", [1.0])
+
+    assert archive.find("a").tolist() == [2, 0, 3]
+    assert archive.find("a", start=pd.Timestamp("2024-01-10")).tolist() == [0, 3]
+    assert archive.find("a", end=pd.Timestamp("2024-01-15")).tolist() == [2, 0]
+    assert archive.find("c").tolist() == []
+
+
+def test_find_after_append(tmp_path):
+    """検索後に追記した予測も日付順で検索できることのテスト"""
+    archive = ForecastArchive(str(tmp_path))
+    append_forecast(archive, "a", "2024-01-15", [1.0])
+    append_forecast(archive, "b", "2024-01-01", [1.0])
+    assert archive.find("a").tolist() == [0]
+
+    append_forecast(archive, "a", "2024-01-01", [1.0])
+    append_forecast(archive, "c", "2024-01-01", [1.0])
+    assert archive.find("a").tolist() == [2, 0]
+    assert archive.find("c").tolist() == [3]
+
+    # 別のインスタンスからの追記も反映される
+    append_forecast(ForecastArchive(str(tmp_path)), "a", "2024-01-08", [1.0])
+    assert archive.find("a").tolist() == [2, 4, 0]
+    assert archive.find("a", start="2024-01-02", end="2024-01-08").tolist() == [4]
+
+
+def test_percentile_trend(tmp_path):
+    """パーセンタイルラインの推移のテスト"""
+    archive = ForecastArchive(str(tmp_path))
+    append_forecast(archive, "a", "2024-01-15", np.arange(101))
+    append_forecast(archive, "a", "2024-01-01", np.arange(101) * 2)
+
+    trend = archive.percentile_trend("a", percentiles=(50, 80))
+    assert trend.index.tolist() == [
+        pd.Timestamp("2024-01-01"),
+        pd.Timestamp("2024-01-15"),
+    ]
+    assert trend["p50"].tolist() == [100.0, 50.0]
+    assert trend["p80"].tolist() == [160.0, 80.0]
+
+
+def test_finish_date_trend(tmp_path):
+    """パーセンタイルラインの終了日の推移のテスト"""
+    archive = ForecastArchive(str(tmp_path))
+    append_forecast(archive, "a", "2024-01-15", np.full(10, 2.5), "2024-01-15")
+    append_forecast(archive, "a", "2024-01-01", np.full(10, 1.0), "2024-01-08")
+
+    trend = archive.finish_date_trend("a", percentiles=(80,))
+    assert trend.index.tolist() == [
+        pd.Timestamp("2024-01-01"),
+        pd.Timestamp("2024-01-15"),
+    ]
+    # 開始日 + スプリント数 × 14日（端数切り捨て）
+    assert trend["p80"].tolist() == [
+        pd.Timestamp("2024-01-22"),
+        pd.Timestamp("2024-02-19"),
+    ]
+
+
+def test_percentile_trend_opens_files_once(tmp_path, monkeypatch):
+    """予測の件数によらずファイルを一度だけ開くことのテスト"""
+    archive = ForecastArchive(str(tmp_path))
+    for day in range(1, 6):
+        append_forecast(archive, "a", f"2024-01-0{day}", np.arange(10))
+
+    opened = []
+    original = archive._open
+    monkeypatch.setattr(
+        archive,
+        "_open",
+        lambda name, dtype: opened.append(name) or original(name, dtype),
+    )
+    assert len(archive.percentile_trend("a")) == 5
+    assert sorted(opened) == ["index.bin", "samples.f32"]
+
+
+@pytest.mark.parametrize("team", ["", "a" * 33])
+def test_append_invalid_team(tmp_path, team):
+    """不正なチーム名の場合のテスト"""
+    archive = ForecastArchive(str(tmp_path))
+    with pytest.raises(ValueError):
+        append_forecast(archive, team, "2024-01-01", [1.0])
+
+
+def test_append_empty_results(tmp_path):
+    """空のシミュレーション結果を保存しようとした場合のテスト"""
+    archive = ForecastArchive(str(tmp_path))
+    append_forecast(archive, "a", "2024-01-01", [1.0])
+    with pytest.raises(ValueError):
+        append_forecast(archive, "a", "2024-01-02", [])
+    assert len(archive.records) == 1
+    assert len(archive.percentile_trend("a")) == 1
@@ -4,7 +4,7 @@ import numpy as np
 import pytest
 from conftest import create_mock_velocity_sampler
 
-from hello import monte_carlo_simulation
+from hello import monte_carlo_simulation, simulate_sprints
 
 
 @pytest.mark.parametrize(
@@ -43,3 +43,20 @@ def test_monte_carlo_invalid_sampler():
             scope_creep_std_dev=0.0,
             num_simulations=1000,
         )
+
+
+def test_simulate_sprints_batch_shape():
+    """複数の予測をまとめてシミュレーションした場合のテスト"""
+    story_points = np.array([[100.0], [50.0], [-1.0]])
+    velocities = np.full((3, 500), 10.0)
+    results = simulate_sprints(story_points, velocities, 0.0, 0.0)
+    assert results.shape == (3, 500)
+    assert np.all(results[0] == 10.0)
+    assert np.all(results[1] == 5.0)
+    assert np.all(results[2] == 0.0)
+
+
+def test_simulate_sprints_negative_velocity():
+    """負のベロシティは0として扱われることのテスト"""
+    results = simulate_sprints(100.0, np.array([-5.0, 10.0]), 0.0, 0.0)
+    assert results.tolist() == [301.0, 10.0]
@@ -0,0 +1,77 @@
+"""乱数生成器とシードによる再現性のテスト"""
+
+import numpy as np
+import pytest
+
+from hello import (
+    BIT_GENERATORS,
+    backtest_forecasts,
+    create_rng,
+    create_velocity_sampler,
+    guess_velocity_posterior,
+    monte_carlo_simulation,
+)
+
+
+@pytest.mark.parametrize("bit_generator", list(BIT_GENERATORS))
+def test_create_rng(bit_generator):
+    """指定した乱数生成器が使われることのテスト"""
+    rng = create_rng(42, bit_generator)
+    assert isinstance(rng, np.random.Generator)
+    assert isinstance(rng.bit_generator, BIT_GENERATORS[bit_generator])
+    assert np.array_equal(rng.random(10), create_rng(42, bit_generator).random(10))
+
+
+def test_create_rng_invalid_bit_generator():
+    """未対応の乱数生成器の場合のテスト"""
+    with pytest.raises(ValueError):
+        create_rng(42, "invalid")
+
+
+@pytest.mark.parametrize(
+    "sampler_factory", [create_velocity_sampler, guess_velocity_posterior]
+)
+def test_sampler_same_seed(sampler_factory, sample_velocity_data):
+    """同じシードのサンプラーが同じ値を返すことのテスト"""
+    first = sampler_factory(sample_velocity_data, rng=1)(1000)
+    second = sampler_factory(sample_velocity_data, rng=create_rng(1))(1000)
+    other = sampler_factory(sample_velocity_data, rng=2)(1000)
+    assert np.array_equal(first, second)
+    assert not np.array_equal(first, other)
+
+
+@pytest.mark.parametrize("bit_generator", ["PCG64", "SFC64"])
+def test_monte_carlo_same_seed(bit_generator, sample_velocity_data):
+    """同じシードのシミュレーションが同じ結果になることのテスト"""
+
+    def simulate(seed):
+        rng = create_rng(seed, bit_generator)
+        return monte_carlo_simulation(
+            story_point=100,
+            velocity_sampler=create_velocity_sampler(sample_velocity_data, rng=rng),
+            scope_creep_mean=2.0,
+            scope_creep_std_dev=2.0,
+            num_simulations=1000,
+            rng=rng,
+        )
+
+    assert np.array_equal(simulate(7), simulate(7))
+    assert not np.array_equal(simulate(7), simulate(8))
+
+
+def test_backtest_same_seed():
+    """同じシードのバックテストが同じ結果になることのテスト"""
+    histories = {"a": [10.0, 12.0, 8.0, 11.0, 9.0], "b": [5.0, 6.0, 4.0]}
+
+    def backtest(seed):
+        return backtest_forecasts(
+            histories,
+            scope_creep_mean=2.0,
+            scope_creep_std_dev=2.0,
+            num_simulations=200,
+            batch_size=2,
+            rng=seed,
+        )
+
+    assert backtest(3).equals(backtest(3))
+    assert not backtest(3).equals(backtest(4))